@@ -0,0 +1,59 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import re
+from typing import Dict, Generator, NamedTuple
+
+import pytest
+
+from playwright.sync_api import BrowserContext, Route
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+@pytest.fixture(scope="session")
+def todomvc_cache() -> Dict[str, CachedResponse]:
+    # Shared across all tests of the session, the demo app is only fetched from
+    # the network once and every subsequent navigation is served from memory.
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def serve_todomvc_from_cache(
+    context: BrowserContext, todomvc_cache: Dict[str, CachedResponse]
+) -> Generator[None, None, None]:
+    def handle(route: Route) -> None:
+        if route.request.method != "GET":
+            route.continue_()
+            return
+        url = route.request.url
+        cached = todomvc_cache.get(url)
+        if not cached:
+            # Redirects are replayed as-is so that the browser resolves relative
+            # asset URLs against the final document URL.
+            response = route.fetch(max_redirects=0)
+            cached = CachedResponse(response.status, response.headers, response.body())
+            if response.status < 400:
+                todomvc_cache[url] = cached
+        route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+
+    context.route("**/demo.playwright.dev/**", handle)
+    # Registered last so it takes precedence, also over the cached demo routes.
+    context.route(
+        re.compile(r"(analytics|fonts|gtag|favicon)"), lambda route: route.abort()
+    )
+    yield
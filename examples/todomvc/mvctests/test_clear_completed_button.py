@@ -23,7 +23,7 @@ from .utils import TODO_ITEMS, create_default_todos
 @pytest.fixture(autouse=True)
 def run_around_tests(page: Page) -> Generator[None, None, None]:
     # setup before a test
-    page.goto("https://demo.playwright.dev/todomvc")
+    page.goto("https://demo.playwright.dev/todomvc", wait_until="domcontentloaded")
     create_default_todos(page)
     # run the actual test
     yield
@@ -28,7 +28,7 @@ from .utils import (
 @pytest.fixture(autouse=True)
 def run_around_tests(page: Page) -> Generator[None, None, None]:
     # setup before a test
-    page.goto("https://demo.playwright.dev/todomvc")
+    page.goto("https://demo.playwright.dev/todomvc", wait_until="domcontentloaded")
     create_default_todos(page)
     assert_number_of_todos_in_local_storage(page, 3)
     # run the actual test
@@ -28,7 +28,7 @@ from .utils import (
 @pytest.fixture(autouse=True)
 def run_around_tests(page: Page) -> Generator[None, None, None]:
     # setup before a test
-    page.goto("https://demo.playwright.dev/todomvc")
+    page.goto("https://demo.playwright.dev/todomvc", wait_until="domcontentloaded")
     # run the actual test
     yield
     # run any cleanup code
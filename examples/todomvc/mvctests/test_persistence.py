@@ -23,16 +23,26 @@ from .utils import TODO_ITEMS, check_number_of_completed_todos_in_local_storage
 @pytest.fixture(autouse=True)
 def run_around_tests(page: Page) -> Generator[None, None, None]:
     # setup before a test
-    page.goto("https://demo.playwright.dev/todomvc")
+    page.goto("https://demo.playwright.dev/todomvc", wait_until="domcontentloaded")
     # run the actual test
     yield
     # run any cleanup code
 
 
 def test_should_persist_its_data(page: Page) -> None:
-    for item in TODO_ITEMS[:2]:
-        page.locator(".new-todo").fill(item)
-        page.locator(".new-todo").press("Enter")
+    # Seed the todos straight into storage, the UI path for creating them is
+    # covered by test_new_todo.py.
+    page.evaluate(
+        """items => {
+            localStorage['react-todos'] = JSON.stringify(items.map(title => ({
+                id: crypto.randomUUID(),
+                title,
+                completed: false,
+            })));
+        }""",
+        TODO_ITEMS[:2],
+    )
+    page.reload(wait_until="domcontentloaded")
 
     todo_items = page.locator(".todo-list li")
     todo_items.nth(0).locator(".toggle").check()
@@ -28,7 +28,7 @@ from .utils import (
 @pytest.fixture(autouse=True)
 def run_around_tests(page: Page) -> Generator[None, None, None]:
     # setup before a test
-    page.goto("https://demo.playwright.dev/todomvc")
+    page.goto("https://demo.playwright.dev/todomvc", wait_until="domcontentloaded")
     create_default_todos(page)
     # make sure the app had a chance to save updated todos in storage
     # before navigating to a new view, otherwise the items can get lost :(
@@ -17,9 +17,10 @@ TODO_ITEMS = ["buy some cheese", "feed the cat", "book a doctors appointment"]
 
 
 def create_default_todos(page: Page) -> None:
+    new_todo = page.locator(".new-todo")
     for item in TODO_ITEMS:
-        page.locator(".new-todo").fill(item)
-        page.locator(".new-todo").press("Enter")
+        new_todo.fill(item)
+        new_todo.press("Enter")
 
 
 def check_number_of_completed_todos_in_local_storage(page: Page, expected: int) -> None:
@@ -35,6 +36,20 @@ def assert_number_of_todos_in_local_storage(page: Page, expected: int) -> None:
     assert len(page.evaluate("JSON.parse(localStorage['react-todos'])")) == expected
 
 
+def check_todos_state_in_local_storage(
+    page: Page, expected_total: int, expected_completed: int
+) -> None:
+    assert (
+        page.evaluate(
+            """() => {
+            const todos = JSON.parse(localStorage['react-todos']);
+            return [todos.length, todos.filter(i => i.completed).length];
+        }"""
+        )
+        == [expected_total, expected_completed]
+    )
+
+
 def check_todos_in_local_storage(page: Page, title: str) -> None:
     assert title in page.evaluate(
         "JSON.parse(localStorage['react-todos']).map(i => i.title)"
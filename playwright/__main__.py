@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import subprocess
 import sys
 
@@ -21,9 +22,12 @@ from playwright._impl._driver import compute_driver_executable, get_driver_env
 def main() -> None:
     try:
         driver_executable, driver_cli = compute_driver_executable()
-        completed_process = subprocess.run(
-            [driver_executable, driver_cli, *sys.argv[1:]], env=get_driver_env()
-        )
+        args = [driver_executable, driver_cli, *sys.argv[1:]]
+        if sys.platform != "win32":
+            # Replace the Python process with the driver instead of keeping it
+            # around just to wait for the child and forward its exit code.
+            os.execvpe(driver_executable, args, get_driver_env())
+        completed_process = subprocess.run(args, env=get_driver_env())
         sys.exit(completed_process.returncode)
     except KeyboardInterrupt:
         sys.exit(130)
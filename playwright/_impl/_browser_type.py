@@ -14,8 +14,9 @@
 
 import asyncio
 import pathlib
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional, Pattern, Sequence, Union, cast
+from typing import TYPE_CHECKING, Dict, Optional, Pattern, Sequence, Union
 
 from playwright._impl._api_structures import (
     Geolocation,
@@ -44,7 +45,6 @@ from playwright._impl._helper import (
 )
 from playwright._impl._json_pipe import JsonPipeTransport
 from playwright._impl._network import serialize_headers
-from playwright._impl._waiter import throw_on_timeout
 
 if TYPE_CHECKING:
     from playwright._impl._playwright import Playwright
@@ -90,9 +90,7 @@ class BrowserType(ChannelOwner):
     ) -> Browser:
         params = locals_to_params(locals())
         normalize_launch_params(params)
-        browser = cast(
-            Browser, from_channel(await self._channel.send("launch", params))
-        )
+        browser: Browser = from_channel(await self._channel.send("launch", params))
         self._did_launch_browser(browser)
         return browser
 
@@ -152,9 +150,8 @@ class BrowserType(ChannelOwner):
         params = locals_to_params(locals())
         await prepare_browser_context_params(params)
         normalize_launch_params(params)
-        context = cast(
-            BrowserContext,
-            from_channel(await self._channel.send("launchPersistentContext", params)),
+        context: BrowserContext = from_channel(
+            await self._channel.send("launchPersistentContext", params)
         )
         self._did_create_context(context, params, params)
         return context
@@ -170,12 +167,11 @@ class BrowserType(ChannelOwner):
         if params.get("headers"):
             params["headers"] = serialize_headers(params["headers"])
         response = await self._channel.send_return_as_dict("connectOverCDP", params)
-        browser = cast(Browser, from_channel(response["browser"]))
+        browser: Browser = from_channel(response["browser"])
         self._did_launch_browser(browser)
 
-        default_context = cast(
-            Optional[BrowserContext],
-            from_nullable_channel(response.get("defaultContext")),
+        default_context: Optional[BrowserContext] = from_nullable_channel(
+            response.get("defaultContext")
         )
         if default_context:
             self._did_create_context(default_context, {}, {})
@@ -194,7 +190,11 @@ class BrowserType(ChannelOwner):
         if slowMo is None:
             slowMo = 0
 
-        headers = {**(headers if headers else {}), "x-playwright-browser": self.name}
+        headers = (
+            {**headers, "x-playwright-browser": self.name}
+            if headers
+            else {"x-playwright-browser": self.name}
+        )
         local_utils = self._connection.local_utils
         pipe_channel = (
             await local_utils._channel.send_return_as_dict(
@@ -219,7 +219,7 @@ class BrowserType(ChannelOwner):
         )
         connection.mark_as_remote()
 
-        browser = None
+        browser: Optional[Browser] = None
 
         def handle_transport_close(reason: Optional[str]) -> None:
             if browser:
@@ -236,21 +236,22 @@ class BrowserType(ChannelOwner):
         connection._loop.create_task(connection.run())
         playwright_future = connection.playwright_future
 
-        timeout_future = throw_on_timeout(timeout, Error("Connection timed out"))
         done, pending = await asyncio.wait(
-            {transport.on_error_future, playwright_future, timeout_future},
+            {transport.on_error_future, playwright_future},
+            timeout=timeout / 1000,
             return_when=asyncio.FIRST_COMPLETED,
         )
         if not playwright_future.done():
             playwright_future.cancel()
-        if not timeout_future.done():
-            timeout_future.cancel()
+        if not done:
+            raise Error("Connection timed out")
         playwright: "Playwright" = next(iter(done)).result()
         playwright._set_selectors(self._playwright.selectors)
         self._connection._child_ws_connections.append(connection)
         pre_launched_browser = playwright._initializer.get("preLaunchedBrowser")
         assert pre_launched_browser
-        browser = cast(Browser, from_channel(pre_launched_browser))
+        browser = from_channel(pre_launched_browser)
+        assert browser
         self._did_launch_browser(browser)
         browser._should_close_connection_on_close = True
 
@@ -268,16 +269,27 @@ class BrowserType(ChannelOwner):
 def normalize_launch_params(params: Dict) -> None:
     if "env" in params:
         params["env"] = [
-            {"name": name, "value": str(value)}
-            for [name, value] in params["env"].items()
+            {"name": name, "value": value if type(value) is str else str(value)}
+            for name, value in params["env"].items()
         ]
     if "ignoreDefaultArgs" in params:
         if params["ignoreDefaultArgs"] is True:
             params["ignoreAllDefaultArgs"] = True
             del params["ignoreDefaultArgs"]
     if "executablePath" in params:
-        params["executablePath"] = str(Path(params["executablePath"]))
+        params["executablePath"] = _normalize_path(params["executablePath"])
     if "downloadsPath" in params:
-        params["downloadsPath"] = str(Path(params["downloadsPath"]))
+        params["downloadsPath"] = _normalize_path(params["downloadsPath"])
     if "tracesDir" in params:
-        params["tracesDir"] = str(Path(params["tracesDir"]))
+        params["tracesDir"] = _normalize_path(params["tracesDir"])
+
+
+def _normalize_path(path: Union[str, Path]) -> str:
+    if isinstance(path, str):
+        return _normalize_path_string(path)
+    return str(Path(path))
+
+
+@lru_cache(maxsize=256)
+def _normalize_path_string(path: str) -> str:
+    return str(Path(path))
@@ -16,10 +16,10 @@ import asyncio
 import collections.abc
 import contextvars
 import datetime
-import inspect
 import sys
 import traceback
 from pathlib import Path
+from types import FrameType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -28,11 +28,13 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Tuple,
     TypedDict,
     Union,
     cast,
 )
 
+import greenlet
 from pyee import EventEmitter
 from pyee.asyncio import AsyncIOEventEmitter
 
@@ -85,16 +87,24 @@ class Channel(AsyncIOEventEmitter):
         callback = self._connection._send_message_to_server(
             self._object, method, _filter_none(params)
         )
-        done, _ = await asyncio.wait(
-            {
-                self._connection._transport.on_error_future,
-                callback.future,
-            },
-            return_when=asyncio.FIRST_COMPLETED,
-        )
-        if not callback.future.done():
-            callback.future.cancel()
-        result = next(iter(done)).result()
+        # Race the reply against a transport error without asyncio.wait, which
+        # allocates a waiter future and a set for every call.
+        error_future = self._connection._transport.on_error_future
+
+        def _cancel_callback(_: asyncio.Future) -> None:
+            if not callback.future.done():
+                callback.future.cancel()
+
+        error_future.add_done_callback(_cancel_callback)
+        try:
+            result = await callback.future
+        except asyncio.CancelledError:
+            if error_future.done():
+                result = error_future.result()
+            else:
+                raise
+        finally:
+            error_future.remove_done_callback(_cancel_callback)
         # Protocol now has named return values, assume result is one level deeper unless
         # there is explicit ambiguity.
         if not result:
@@ -132,6 +142,8 @@ class ChannelOwner(AsyncIOEventEmitter):
         self._channel: Channel = Channel(self._connection, self)
         self._initializer = initializer
         self._was_collected = False
+        # Messages relayed through a JSON pipe belong to another connection.
+        self._should_replace_guids_in_events = "jsonPipe@" not in guid
 
         self._connection._objects[guid] = self
         if self._parent:
@@ -181,26 +193,14 @@ class ChannelOwner(AsyncIOEventEmitter):
 
 
 class ProtocolCallback:
+    __slots__ = ("stack_trace", "no_reply", "future")
+
     def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
         self.stack_trace: traceback.StackSummary
         self.no_reply: bool
+        # Channel.inner_send awaits this future directly, so when the outer task
+        # gets cancelled by the user, asyncio cancels the future along with it.
         self.future = loop.create_future()
-        # The outer task can get cancelled by the user, this forwards the cancellation to the inner task.
-        current_task = asyncio.current_task()
-
-        def cb(task: asyncio.Task) -> None:
-            if current_task:
-                current_task.remove_done_callback(cb)
-            if task.cancelled():
-                self.future.cancel()
-
-        if current_task:
-            current_task.add_done_callback(cb)
-            self.future.add_done_callback(
-                lambda _: current_task.remove_done_callback(cb)
-                if current_task
-                else None
-            )
 
 
 class RootChannelOwner(ChannelOwner):
@@ -218,6 +218,13 @@ class RootChannelOwner(ChannelOwner):
         )
 
 
+# Payload leaves that never contain channels or guids.
+_SCALAR_TYPES = {str, int, float, bool, type(None)}
+
+# Upper bound on parked event greenlets kept around for reuse in sync mode.
+_MAX_IDLE_EVENT_GREENLETS = 16
+
+
 class Connection(EventEmitter):
     def __init__(
         self,
@@ -238,6 +245,7 @@ class Connection(EventEmitter):
         self._object_factory = object_factory
         self._is_sync = False
         self._child_ws_connections: List["Connection"] = []
+        self._idle_event_greenlets: List[EventGreenlet] = []
         self._loop = loop
         self.playwright_future: asyncio.Future["Playwright"] = loop.create_future()
         self._error: Optional[BaseException] = None
@@ -296,6 +304,7 @@ class Connection(EventEmitter):
                 continue
             callback.future.set_exception(self._closed_error)
         self._callbacks.clear()
+        self._idle_event_greenlets.clear()
         self.emit("close")
 
     def call_on_object_with_known_name(
@@ -322,9 +331,8 @@ class Connection(EventEmitter):
         id = self._last_id
         callback = ProtocolCallback(self._loop)
         task = asyncio.current_task(self._loop)
-        callback.stack_trace = cast(
-            traceback.StackSummary,
-            getattr(task, "__pw_stack_trace__", traceback.extract_stack()),
+        callback.stack_trace = (
+            getattr(task, "__pw_stack_trace__", None) or capture_stack_trace()
         )
         callback.no_reply = no_reply
         self._callbacks[id] = callback
@@ -357,7 +365,6 @@ class Connection(EventEmitter):
             self.local_utils.add_stack_to_tracing_no_reply(id, frames)
 
         self._transport.send(message)
-        self._callbacks[id] = callback
 
         return callback
 
@@ -379,7 +386,7 @@ class Connection(EventEmitter):
                     error["error"], format_call_log(msg.get("log"))  # type: ignore
                 )
                 parsed_error._stack = "".join(
-                    traceback.format_list(callback.stack_trace)[-10:]
+                    traceback.format_list(callback.stack_trace[-10:])
                 )
                 callback.future.set_exception(parsed_error)
             else:
@@ -415,10 +422,15 @@ class Connection(EventEmitter):
             self._objects[guid]._dispose(cast(Optional[str], params.get("reason")))
             return
         object = self._objects[guid]
-        should_replace_guids_with_channels = "jsonPipe@" not in guid
+        channel = object._channel
+        # Nobody listens to this event, skip walking its params.
+        if method not in channel._events:
+            return
         try:
+            if object._should_replace_guids_in_events:
+                params = self._replace_guids_with_channels(params)
             if self._is_sync:
-                for listener in object._channel.listeners(method):
+                for listener in channel.listeners(method):
                     # Event handlers like route/locatorHandlerTriggered require us to perform async work.
                     # In order to report their potential errors to the user, we need to catch it and store it in the connection
                     def _done_callback(future: asyncio.Future) -> None:
@@ -431,24 +443,39 @@ class Connection(EventEmitter):
                         if asyncio.isfuture(potential_future):
                             potential_future.add_done_callback(_done_callback)
 
-                    # Each event handler is a potentilly blocking context, create a fiber for each
-                    # and switch to them in order, until they block inside and pass control to each
-                    # other and then eventually back to dispatcher as listener functions return.
-                    g = EventGreenlet(_listener_with_error_handler_attached)
-                    if should_replace_guids_with_channels:
-                        g.switch(self._replace_guids_with_channels(params))
+                    # Each event handler is a potentilly blocking context, run each in its own fiber
+                    # (reused from the idle pool when possible) and switch to them in order, until
+                    # they block inside and pass control to each other and then eventually back to
+                    # dispatcher as listener functions return.
+                    if self._idle_event_greenlets:
+                        g = self._idle_event_greenlets.pop()
                     else:
-                        g.switch(params)
+                        g = EventGreenlet(self._run_event_listeners)
+                        g.switch()
+                    g.switch(_listener_with_error_handler_attached, params)
             else:
-                if should_replace_guids_with_channels:
-                    object._channel.emit(
-                        method, self._replace_guids_with_channels(params)
-                    )
-                else:
-                    object._channel.emit(method, params)
+                channel.emit(method, params)
         except BaseException as exc:
             self._on_event_listener_error(exc)
 
+    def _run_event_listeners(self) -> None:
+        # Event greenlets are reused: once a listener returns, park the greenlet in
+        # the idle pool and hand control back until dispatch passes the next one.
+        # Listeners are only ever received through switch() rather than as run()
+        # arguments, which greenlet would keep alive until run() returns. The current
+        # greenlet is not kept in a local either: greenlet cannot collect a cycle
+        # running through a suspended frame, so it would never be freed.
+        while True:
+            listener, params = greenlet.getcurrent().parent.switch()
+            listener(params)
+            # Do not keep the last listener and its payload alive while parked.
+            del listener, params
+            if len(self._idle_event_greenlets) >= _MAX_IDLE_EVENT_GREENLETS:
+                return
+            self._idle_event_greenlets.append(
+                cast(EventGreenlet, greenlet.getcurrent())
+            )
+
     def _on_event_listener_error(self, exc: BaseException) -> None:
         print("Error occurred in event listener", file=sys.stderr)
         traceback.print_exception(type(exc), exc, exc.__traceback__, file=sys.stderr)
@@ -468,35 +495,37 @@ class Connection(EventEmitter):
         self,
         payload: Any,
     ) -> Any:
-        if payload is None:
+        if type(payload) in _SCALAR_TYPES:
             return payload
+        if isinstance(payload, dict):
+            return {
+                key: self._replace_channels_with_guids(value)
+                for key, value in payload.items()
+            }
         if isinstance(payload, Path):
             return str(payload)
         if isinstance(payload, collections.abc.Sequence) and not isinstance(
             payload, str
         ):
-            return list(map(self._replace_channels_with_guids, payload))
+            return [self._replace_channels_with_guids(item) for item in payload]
         if isinstance(payload, Channel):
             return dict(guid=payload._guid)
-        if isinstance(payload, dict):
-            result = {}
-            for key, value in payload.items():
-                result[key] = self._replace_channels_with_guids(value)
-            return result
         return payload
 
     def _replace_guids_with_channels(self, payload: Any) -> Any:
-        if payload is None:
+        if type(payload) in _SCALAR_TYPES:
             return payload
         if isinstance(payload, list):
-            return list(map(self._replace_guids_with_channels, payload))
+            return [self._replace_guids_with_channels(item) for item in payload]
         if isinstance(payload, dict):
-            if payload.get("guid") in self._objects:
-                return self._objects[payload["guid"]]._channel
-            result = {}
-            for key, value in payload.items():
-                result[key] = self._replace_guids_with_channels(value)
-            return result
+            objects = self._objects
+            guid = payload.get("guid")
+            if guid in objects:
+                return objects[guid]._channel
+            return {
+                key: self._replace_guids_with_channels(value)
+                for key, value in payload.items()
+            }
         return payload
 
     async def wrap_api_call(
@@ -504,9 +533,7 @@ class Connection(EventEmitter):
     ) -> Any:
         if self._api_zone.get():
             return await cb()
-        task = asyncio.current_task(self._loop)
-        st: List[inspect.FrameInfo] = getattr(task, "__pw_stack__", inspect.stack())
-        parsed_st = _extract_stack_trace_information_from_stack(st, is_internal)
+        parsed_st = self._parse_api_call_stack(is_internal)
         self._api_zone.set(parsed_st)
         try:
             return await cb()
@@ -515,14 +542,21 @@ class Connection(EventEmitter):
         finally:
             self._api_zone.set(None)
 
+    def _parse_api_call_stack(self, is_internal: bool) -> "ParsedStackTrace":
+        # Internal calls are reported without an API name or location, so there
+        # is no need to walk the stack for them.
+        if is_internal:
+            return {"frames": [], "apiName": ""}
+        task = asyncio.current_task(self._loop)
+        st: CapturedStack = getattr(task, "__pw_stack__", None) or capture_stack()
+        return _extract_stack_trace_information_from_stack(st)
+
     def wrap_api_call_sync(
         self, cb: Callable[[], Any], is_internal: bool = False
     ) -> Any:
         if self._api_zone.get():
             return cb()
-        task = asyncio.current_task(self._loop)
-        st: List[inspect.FrameInfo] = getattr(task, "__pw_stack__", inspect.stack())
-        parsed_st = _extract_stack_trace_information_from_stack(st, is_internal)
+        parsed_st = self._parse_api_call_stack(is_internal)
         self._api_zone.set(parsed_st)
         try:
             return cb()
@@ -540,6 +574,40 @@ def from_nullable_channel(channel: Optional[Channel]) -> Optional[Any]:
     return channel._object if channel else None
 
 
+_playwright_module_path = str(Path(playwright.__file__).parent)
+
+# (filename, line, function) per frame, innermost first like inspect.stack().
+CapturedStack = List[Tuple[str, int, str]]
+
+
+def capture_stack() -> CapturedStack:
+    # Unlike inspect.stack(), walk the frames directly and never look up
+    # source lines, only the location and function name are needed.
+    stack: CapturedStack = []
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame:
+        code = frame.f_code
+        method_name = code.co_name
+        if "self" in code.co_varnames or "self" in code.co_freevars:
+            frame_locals = frame.f_locals
+            if "self" in frame_locals:
+                self_class = frame_locals["self"].__class__
+                method_name = f"{self_class.__name__}.{method_name}"
+        stack.append((code.co_filename, frame.f_lineno, method_name))
+        frame = frame.f_back
+    return stack
+
+
+def capture_stack_trace() -> traceback.StackSummary:
+    # Same as traceback.extract_stack(), but source lines are only read when the
+    # summary gets formatted, which only happens if the call fails.
+    stack_trace = traceback.StackSummary.extract(
+        traceback.walk_stack(sys._getframe(1)), lookup_lines=False
+    )
+    stack_trace.reverse()
+    return stack_trace
+
+
 class StackFrame(TypedDict):
     file: str
     line: int
@@ -552,26 +620,18 @@ class ParsedStackTrace(TypedDict):
     apiName: Optional[str]
 
 
-def _extract_stack_trace_information_from_stack(
-    st: List[inspect.FrameInfo], is_internal: bool
-) -> ParsedStackTrace:
-    playwright_module_path = str(Path(playwright.__file__).parents[0])
+def _extract_stack_trace_information_from_stack(st: CapturedStack) -> ParsedStackTrace:
     last_internal_api_name = ""
     api_name = ""
     parsed_frames: List[StackFrame] = []
-    for frame in st:
-        is_playwright_internal = frame.filename.startswith(playwright_module_path)
-
-        method_name = ""
-        if "self" in frame[0].f_locals:
-            method_name = frame[0].f_locals["self"].__class__.__name__ + "."
-        method_name += frame[0].f_code.co_name
+    for filename, line, method_name in st:
+        is_playwright_internal = filename.startswith(_playwright_module_path)
 
         if not is_playwright_internal:
             parsed_frames.append(
                 {
-                    "file": frame.filename,
-                    "line": frame.lineno,
+                    "file": filename,
+                    "line": line,
                     "column": 0,
                     "function": method_name,
                 }
@@ -586,7 +646,7 @@ def _extract_stack_trace_information_from_stack(
 
     return {
         "frames": parsed_frames,
-        "apiName": "" if is_internal else api_name,
+        "apiName": api_name,
     }
 
 
@@ -21,16 +21,13 @@ from typing import Tuple
 import playwright
 from playwright._repo_version import version
 
+_driver_path = Path(inspect.getfile(playwright)).parent / "driver"
+_node_path = str(_driver_path / ("node.exe" if sys.platform == "win32" else "node"))
+_cli_path = str(_driver_path / "package" / "cli.js")
+
 
 def compute_driver_executable() -> Tuple[str, str]:
-    driver_path = Path(inspect.getfile(playwright)).parent / "driver"
-    cli_path = str(driver_path / "package" / "cli.js")
-    if sys.platform == "win32":
-        return (
-            os.getenv("PLAYWRIGHT_NODEJS_PATH", str(driver_path / "node.exe")),
-            cli_path,
-        )
-    return (os.getenv("PLAYWRIGHT_NODEJS_PATH", str(driver_path / "node")), cli_path)
+    return (os.getenv("PLAYWRIGHT_NODEJS_PATH", _node_path), _cli_path)
 
 
 def get_driver_env() -> dict:
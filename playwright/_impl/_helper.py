@@ -17,6 +17,7 @@ import os
 import re
 import time
 import traceback
+from functools import lru_cache
 from pathlib import Path
 from types import TracebackType
 from typing import (
@@ -142,6 +143,8 @@ Env = Dict[str, Union[str, float, bool]]
 
 
 class URLMatcher:
+    __slots__ = ("_callback", "_regex_obj", "match")
+
     def __init__(self, base_url: Union[str, None], match: URLMatch) -> None:
         self._callback: Optional[Callable[[str], bool]] = None
         self._regex_obj: Optional[Pattern[str]] = None
@@ -160,7 +163,7 @@ class URLMatcher:
         if self._callback:
             return self._callback(url)
         if self._regex_obj:
-            return cast(bool, self._regex_obj.search(url))
+            return self._regex_obj.search(url) is not None
         return False
 
 
@@ -174,6 +177,8 @@ class HarLookupResult(TypedDict, total=False):
 
 
 class TimeoutSettings:
+    __slots__ = ("_parent", "_default_timeout", "_default_navigation_timeout")
+
     def __init__(self, parent: Optional["TimeoutSettings"]) -> None:
         self._parent = parent
         self._default_timeout: Optional[float] = None
@@ -241,13 +246,9 @@ def patch_error_message(message: str) -> str:
 
 
 def locals_to_params(args: Dict) -> Dict:
-    copy = {}
-    for key in args:
-        if key == "self":
-            continue
-        if args[key] is not None:
-            copy[key] = args[key]
-    return copy
+    return {
+        key: value for key, value in args.items() if value is not None and key != "self"
+    }
 
 
 def monotonic_time() -> int:
@@ -264,6 +265,16 @@ class RouteHandlerInvocation:
 
 
 class RouteHandler:
+    __slots__ = (
+        "matcher",
+        "handler",
+        "_times",
+        "_handled_count",
+        "_is_sync",
+        "_ignore_exception",
+        "_active_invocations",
+    )
+
     def __init__(
         self,
         matcher: URLMatcher,
@@ -283,9 +294,7 @@ class RouteHandler:
         return self.matcher.matches(request_url)
 
     async def handle(self, route: "Route") -> bool:
-        handler_invocation = RouteHandlerInvocation(
-            asyncio.get_running_loop().create_future(), route
-        )
+        handler_invocation = RouteHandlerInvocation(route._loop.create_future(), route)
         self._active_invocations.add(handler_invocation)
         try:
             return await self._handle_internal(route)
@@ -376,6 +385,7 @@ class RouteHandler:
 to_snake_case_regex = re.compile("((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))")
 
 
+@lru_cache(maxsize=1024)
 def to_snake_case(name: str) -> str:
     return to_snake_case_regex.sub(r"_\1", name).lower()
 
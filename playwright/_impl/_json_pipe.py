@@ -49,10 +49,10 @@ class JsonPipeTransport(AsyncIOEventEmitter, Transport):
     async def connect(self) -> None:
         self._stopped_future: asyncio.Future = asyncio.Future()
 
-        def handle_message(message: Dict) -> None:
+        def handle_message(params: Dict) -> None:
             if self._stop_requested:
                 return
-            self.on_message(cast(ParsedMessagePayload, message))
+            self.on_message(cast(ParsedMessagePayload, params["message"]))
 
         def handle_closed(reason: Optional[str]) -> None:
             self.emit("close", reason)
@@ -60,10 +60,7 @@ class JsonPipeTransport(AsyncIOEventEmitter, Transport):
                 self.on_error_future.set_exception(TargetClosedError(reason))
             self._stopped_future.set_result(None)
 
-        self._pipe_channel.on(
-            "message",
-            lambda params: handle_message(params["message"]),
-        )
+        self._pipe_channel.on("message", handle_message)
         self._pipe_channel.on(
             "closed",
             lambda params: handle_closed(params.get("reason")),
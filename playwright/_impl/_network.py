@@ -14,7 +14,6 @@
 
 import asyncio
 import base64
-import inspect
 import json
 import json as json_utils
 import mimetypes
@@ -45,6 +44,7 @@ from playwright._impl._api_structures import (
 )
 from playwright._impl._connection import (
     ChannelOwner,
+    capture_stack,
     from_channel,
     from_nullable_channel,
 )
@@ -498,7 +498,8 @@ class Route(ChannelOwner):
         setattr(
             fut,
             "__pw_stack__",
-            getattr(asyncio.current_task(self._loop), "__pw_stack__", inspect.stack()),
+            getattr(asyncio.current_task(self._loop), "__pw_stack__", None)
+            or capture_stack(),
         )
         target_closed_future = self.request._target_closed_future()
         await asyncio.wait(
@@ -19,7 +19,7 @@ import os
 import subprocess
 import sys
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from playwright._impl._driver import compute_driver_executable, get_driver_env
 from playwright._impl._helper import ParsedMessagePayload
@@ -45,6 +45,15 @@ def _get_stderr_fileno() -> Optional[int]:
         return sys.__stderr__.fileno()
 
 
+# Large messages such as screenshots are read from the driver in chunks of this
+# size, which is also the reader's buffer limit.
+_PIPE_READ_LIMIT = 1 << 20
+
+# Outgoing messages are built from plain dicts and lists, so skip the
+# circular reference bookkeeping and the whitespace after separators.
+_message_encoder = json.JSONEncoder(check_circular=False, separators=(",", ":"))
+
+
 class Transport(ABC):
     def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
         self._loop = loop
@@ -75,7 +84,7 @@ class Transport(ABC):
         pass
 
     def serialize_message(self, message: Dict) -> bytes:
-        msg = json.dumps(message)
+        msg = _message_encoder.encode(message)
         if "DEBUGP" in os.environ:  # pragma: no cover
             print("\x1b[32mSEND>\x1b[0m", json.dumps(message, indent=2))
         return msg.encode()
@@ -92,10 +101,12 @@ class PipeTransport(Transport):
     def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
         super().__init__(loop)
         self._stopped = False
+        self._pending_writes: List[bytes] = []
 
     def request_stop(self) -> None:
         assert self._output
         self._stopped = True
+        self._flush_pending_writes()
         self._output.close()
 
     async def wait_until_stopped(self) -> None:
@@ -124,7 +135,7 @@ class PipeTransport(Transport):
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=_get_stderr_fileno(),
-                limit=32768,
+                limit=_PIPE_READ_LIMIT,
                 env=env,
                 startupinfo=startupinfo,
             )
@@ -143,21 +154,20 @@ class PipeTransport(Transport):
                 if self._stopped:
                     break
                 length = int.from_bytes(buffer, byteorder="little", signed=False)
-                buffer = bytes(0)
+                chunks = []
                 while length:
-                    to_read = min(length, 32768)
+                    to_read = min(length, _PIPE_READ_LIMIT)
                     data = await self._proc.stdout.readexactly(to_read)
                     if self._stopped:
                         break
                     length -= to_read
-                    if len(buffer):
-                        buffer = buffer + data
-                    else:
-                        buffer = data
+                    chunks.append(data)
                 if self._stopped:
                     break
 
-                obj = self.deserialize_message(buffer)
+                obj = self.deserialize_message(
+                    chunks[0] if len(chunks) == 1 else b"".join(chunks)
+                )
                 self.on_message(obj)
             except asyncio.IncompleteReadError:
                 if not self._stopped:
@@ -173,6 +183,18 @@ class PipeTransport(Transport):
     def send(self, message: Dict) -> None:
         assert self._output
         data = self.serialize_message(message)
-        self._output.write(
-            len(data).to_bytes(4, byteorder="little", signed=False) + data
+        # Messages sent during the same event loop iteration are written to the
+        # driver's stdin at once.
+        if not self._pending_writes:
+            self._loop.call_soon(self._flush_pending_writes)
+        self._pending_writes.append(
+            len(data).to_bytes(4, byteorder="little", signed=False)
         )
+        self._pending_writes.append(data)
+
+    def _flush_pending_writes(self) -> None:
+        if not self._pending_writes:
+            return
+        assert self._output
+        self._output.write(b"".join(self._pending_writes))
+        self._pending_writes.clear()
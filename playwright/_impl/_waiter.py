@@ -90,8 +90,10 @@ class Waiter:
         for task in self._pending_tasks:
             if not task.done():
                 task.cancel()
+        self._pending_tasks.clear()
         for listener in self._registered_listeners:
             listener[0].remove_listener(listener[1], listener[2])
+        self._registered_listeners.clear()
 
     def _fulfill(self, result: Any) -> None:
         self._cleanup()
@@ -144,14 +146,6 @@ class Waiter:
             pass
 
 
-def throw_on_timeout(timeout: float, exception: Exception) -> asyncio.Task:
-    async def throw() -> None:
-        await asyncio.sleep(timeout / 1000)
-        raise exception
-
-    return asyncio.create_task(throw())
-
-
 def format_log_recording(log: List[str]) -> str:
     if not log:
         return ""
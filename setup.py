@@ -20,7 +20,7 @@ import subprocess
 import sys
 import zipfile
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 
 from setuptools import setup
 
@@ -140,13 +140,18 @@ class PlaywrightBDistWheelCommand(BDistWheelCommand):
     ) -> None:
         base_wheel_location: str = glob.glob(os.path.join(self.dist_dir, "*.whl"))[0]
         without_platform = base_wheel_location[:-7]
+        extracted_zip_names: Set[str] = set()
         for wheel_bundle in wheels:
-            download_driver(wheel_bundle["zip_name"])
-            zip_file = (
-                f"driver/playwright-{driver_version}-{wheel_bundle['zip_name']}.zip"
-            )
-            with zipfile.ZipFile(zip_file, "r") as zip:
-                extractall(zip, f"driver/{wheel_bundle['zip_name']}")
+            # Several wheels share the same driver archive (e.g. the macOS and
+            # Windows variants), only inflate each of them once.
+            if wheel_bundle["zip_name"] not in extracted_zip_names:
+                download_driver(wheel_bundle["zip_name"])
+                zip_file = (
+                    f"driver/playwright-{driver_version}-{wheel_bundle['zip_name']}.zip"
+                )
+                with zipfile.ZipFile(zip_file, "r") as zip:
+                    extractall(zip, f"driver/{wheel_bundle['zip_name']}")
+                extracted_zip_names.add(wheel_bundle["zip_name"])
             wheel_location = without_platform + wheel_bundle["wheel"]
             shutil.copy(base_wheel_location, wheel_location)
             with zipfile.ZipFile(wheel_location, "a") as zip:
@@ -26,6 +26,8 @@ from playwright.async_api import Browser, BrowserContext, Error, Page, Route, ex
 from tests.server import Server, TestServerRequest
 from tests.utils import must
 
+_HAR_HTML_RE = re.compile("HAR.X?HTML", re.I)
+
 
 async def test_should_work(browser: Browser, server: Server, tmpdir: Path) -> None:
     path = os.path.join(tmpdir, "log.har")
@@ -233,7 +235,7 @@ async def test_should_filter_by_regexp(
     context = await browser.new_context(
         base_url=server.PREFIX,
         record_har_path=path,
-        record_har_url_filter=re.compile("HAR.X?HTML", re.I),
+        record_har_url_filter=_HAR_HTML_RE,
         ignore_https_errors=True,
     )
     page = await context.new_page()
@@ -16,6 +16,8 @@ import multiprocessing
 import os
 import signal
 import sys
+import threading
+from multiprocessing.connection import Connection
 from typing import Any, Dict
 
 import pytest
@@ -25,54 +27,46 @@ from playwright.sync_api import sync_playwright
 
 
 def _test_signals_async(
-    browser_name: str, launch_arguments: Dict, wait_queue: "multiprocessing.Queue[str]"
+    browser_name: str, launch_arguments: Dict, wait_conn: Connection
 ) -> None:
     os.setpgrp()
-    sigint_received = False
-
-    def my_sig_handler(signum: int, frame: Any) -> None:
-        nonlocal sigint_received
-        sigint_received = True
-
-    signal.signal(signal.SIGINT, my_sig_handler)
 
     async def main() -> None:
+        sigint_received = asyncio.Event()
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGINT, sigint_received.set
+        )
         playwright = await async_playwright().start()
         browser = await playwright[browser_name].launch(
             **launch_arguments,
             handle_sigint=False,
         )
         context = await browser.new_context()
-        page = await context.new_page()
-        notified = False
+        await context.new_page()
         try:
-            nonlocal sigint_received
-            while not sigint_received:
-                if not notified:
-                    wait_queue.put("ready")
-                    notified = True
-                await page.wait_for_timeout(100)
+            wait_conn.send("ready")
+            await sigint_received.wait()
         finally:
-            wait_queue.put("close context")
+            progress = ["close context"]
             await context.close()
-            wait_queue.put("close browser")
+            progress.append("close browser")
             await browser.close()
-            wait_queue.put("close playwright")
+            progress.append("close playwright")
             await playwright.stop()
-            wait_queue.put("all done")
+            progress.append("all done")
+            wait_conn.send(progress)
 
     asyncio.run(main())
 
 
 def _test_signals_sync(
-    browser_name: str, launch_arguments: Dict, wait_queue: "multiprocessing.Queue[str]"
+    browser_name: str, launch_arguments: Dict, wait_conn: Connection
 ) -> None:
     os.setpgrp()
-    sigint_received = False
+    sigint_received = threading.Event()
 
     def my_sig_handler(signum: int, frame: Any) -> None:
-        nonlocal sigint_received
-        sigint_received = True
+        sigint_received.set()
 
     signal.signal(signal.SIGINT, my_sig_handler)
 
@@ -82,38 +76,37 @@ def _test_signals_sync(
         handle_sigint=False,
     )
     context = browser.new_context()
-    page = context.new_page()
-    notified = False
+    context.new_page()
     try:
-        while not sigint_received:
-            if not notified:
-                wait_queue.put("ready")
-                notified = True
-            page.wait_for_timeout(100)
+        wait_conn.send("ready")
+        sigint_received.wait()
     finally:
-        wait_queue.put("close context")
+        progress = ["close context"]
         context.close()
-        wait_queue.put("close browser")
+        progress.append("close browser")
         browser.close()
-        wait_queue.put("close playwright")
+        progress.append("close playwright")
         playwright.stop()
-        wait_queue.put("all done")
+        progress.append("all done")
+        wait_conn.send(progress)
 
 
 def _create_signals_test(
     target: Any, browser_name: str, launch_arguments: Dict
 ) -> None:
-    wait_queue: "multiprocessing.Queue[str]" = multiprocessing.Queue()
+    receiver, sender = multiprocessing.Pipe(duplex=False)
     process = multiprocessing.Process(
-        target=target, args=[browser_name, launch_arguments, wait_queue]
+        target=target, args=[browser_name, launch_arguments, sender]
     )
     process.start()
+    # Only the child writes, so that recv() raises EOFError if it dies early.
+    sender.close()
     assert process.pid is not None
-    logs = [wait_queue.get()]
+    logs = [receiver.recv()]
     os.killpg(os.getpgid(process.pid), signal.SIGINT)
+    assert receiver.poll(30)
+    logs += receiver.recv()
     process.join()
-    while not wait_queue.empty():
-        logs.append(wait_queue.get())
     assert logs == [
         "ready",
         "close context",
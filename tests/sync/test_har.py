@@ -24,6 +24,8 @@ import pytest
 from playwright.sync_api import Browser, BrowserContext, Error, Page, Route, expect
 from tests.server import Server
 
+_HAR_HTML_RE = re.compile("HAR.X?HTML", re.I)
+
 
 def test_should_work(browser: Browser, server: Server, tmpdir: Path) -> None:
     path = os.path.join(tmpdir, "log.har")
@@ -202,7 +204,7 @@ def test_should_filter_by_regexp(browser: Browser, server: Server, tmpdir: str)
     context = browser.new_context(
         base_url=server.PREFIX,
         record_har_path=path,
-        record_har_url_filter=re.compile("HAR.X?HTML", re.I),
+        record_har_url_filter=_HAR_HTML_RE,
         ignore_https_errors=True,
     )
     page = context.new_page()
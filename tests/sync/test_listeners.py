@@ -13,7 +13,11 @@
 # limitations under the License.
 
 
-from playwright.sync_api import Page, Response
+from typing import Dict, List
+
+from greenlet import greenlet
+
+from playwright.sync_api import ConsoleMessage, Page, Response
 from tests.server import Server
 
 
@@ -31,3 +35,27 @@ def test_listeners(page: Page, server: Server) -> None:
     log = []
     page.goto(f"{server.PREFIX}/input/textarea.html")
     assert len(log) == 0
+
+
+def test_listener_can_block_while_next_event_is_dispatched(page: Page) -> None:
+    fibers: Dict[str, greenlet] = {}
+    seen_while_blocked: List[str] = []
+
+    def on_console(message: ConsoleMessage) -> None:
+        fibers[message.text] = greenlet.getcurrent()
+        if message.text == "first":
+            # Blocks this listener on a sync API call until the next event.
+            seen_while_blocked.append(page.wait_for_event("console").text)
+
+    page.on("console", on_console)
+    with page.expect_console_message(lambda message: message.text == "second"):
+        page.evaluate(
+            "() => { console.log('first'); setTimeout(() => console.log('second'), 100) }"
+        )
+    with page.expect_console_message(lambda message: message.text == "third"):
+        page.evaluate("() => console.log('third')")
+
+    assert seen_while_blocked == ["second"]
+    assert fibers["first"] is not fibers["second"]
+    # Listener greenlets are parked once they return and reused for later events.
+    assert fibers["third"] in (fibers["first"], fibers["second"])
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
 import multiprocessing
 import os
-from typing import Any, Callable, Dict
+import weakref
+from typing import Any, Callable, Dict, List
 
 import pytest
 
@@ -346,3 +348,35 @@ def test_call_sync_method_after_playwright_close_with_own_loop(
     p.start()
     p.join()
     assert p.exitcode == 0
+
+
+def _test_stopped_sync_playwright_is_freed_after_event_listener_ran(
+    browser_name: str, launch_arguments: Dict[str, Any]
+) -> None:
+    playwright = sync_playwright().start()
+    browser = playwright[browser_name].launch(**launch_arguments)
+    page = browser.new_page()
+    messages: List[str] = []
+    page.on("console", lambda message: messages.append(message.text))
+    with page.expect_console_message():
+        page.evaluate("() => console.log('hello')")
+    assert messages == ["hello"]
+    connection = weakref.ref(page._impl_obj._connection)
+    page_impl = weakref.ref(page._impl_obj)
+    playwright.stop()
+    del playwright, browser, page
+    gc.collect()
+    assert connection() is None
+    assert page_impl() is None
+
+
+def test_stopped_sync_playwright_is_freed_after_event_listener_ran(
+    browser_name: str, launch_arguments: Dict[str, Any]
+) -> None:
+    p = multiprocessing.Process(
+        target=_test_stopped_sync_playwright_is_freed_after_event_listener_ran,
+        args=[browser_name, launch_arguments],
+    )
+    p.start()
+    p.join()
+    assert p.exitcode == 0
@@ -17,6 +17,8 @@ from typing import Any, List, cast
 
 from playwright.sync_api import Error, Frame, Page, Selectors, ViewportSize
 
+_PORT_RE = re.compile(r":\d+/")
+
 
 class Utils:
     def attach_frame(self, page: Page, frame_id: str, url: str) -> Frame:
@@ -43,16 +45,21 @@ class Utils:
         )
 
     def dump_frames(self, frame: Frame, indentation: str = "") -> List[str]:
-        indentation = indentation or ""
-        description = re.sub(r":\d+/", ":<PORT>/", frame.url)
-        if frame.name:
-            description += " (" + frame.name + ")"
-        result = [indentation + description]
-        sorted_frames = sorted(
-            frame.child_frames, key=lambda frame: frame.url + frame.name
-        )
-        for child in sorted_frames:
-            result = result + utils.dump_frames(child, "    " + indentation)
+        result: List[str] = []
+        stack = [(frame, indentation or "")]
+        while stack:
+            frame, indentation = stack.pop()
+            description = _PORT_RE.sub(":<PORT>/", frame.url)
+            if frame.name:
+                description += " (" + frame.name + ")"
+            result.append(indentation + description)
+            sorted_frames = sorted(
+                frame.child_frames, key=lambda frame: frame.url + frame.name
+            )
+            # Pushed in reverse so that children are popped in sorted order.
+            stack.extend(
+                (child, "    " + indentation) for child in reversed(sorted_frames)
+            )
         return result
 
     def verify_viewport(self, page: Page, width: int, height: int) -> None: